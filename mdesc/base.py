@@ -92,7 +92,7 @@ class MdescBase(six.with_metaclass(ABCMeta,
                                         groupbyvars,
                                         round_num=round_num)
 
-        self._model_df = model_df.copy(deep=True).reset_index(drop=True)
+        self._model_df = model_df.reset_index(drop=True)
         self._keepfeaturelist = keepfeaturelist
         self._cat_df = cat_df
         self._modelobj = modelobj
@@ -229,7 +229,7 @@ class MdescBase(six.with_metaclass(ABCMeta,
         logging.info('Converting accuracy outputs to json format')
         # finally convert insights_df into json object
         # convert insights list to dataframe
-        insights_df = pd.concat(insights_list)
+        insights_df = pd.concat(insights_list, ignore_index=True)
         insights_json = formatting.FmtJson.to_json(insights_df.round(self.round_num),
                                                    html_type='accuracy',
                                                    vartype='Accuracy',
@@ -263,11 +263,9 @@ class MdescBase(six.with_metaclass(ABCMeta,
             """Formatting specifications - col: {} - groupbvy_var: {} - cur_group shape: {}""".format(col, groupby_var,
                                                                                                       cur_group.shape))
 
-        # take copy
-        group_copy = cur_group.copy(deep=True)
         # reformat current slice of data for raw_df
-        raw_df = group_copy.rename(columns={col: 'col_value',
-                                            groupby_var: 'groupby_level'}).reset_index(drop=True)
+        raw_df = cur_group.rename(columns={col: 'col_value',
+                                           groupby_var: 'groupby_level'}).reset_index(drop=True)
 
         raw_df['groupByVar'] = groupby_var
         raw_df['col_name'] = col
@@ -292,8 +290,7 @@ class MdescBase(six.with_metaclass(ABCMeta,
 
         logger.info("""Formatting specifications - col: {} - agg_errors shape: {}""".format(col, agg_errors.shape))
 
-        group_copy = agg_errors.copy(deep=True)
-        debug_df = group_copy.rename(columns={col: 'col_value'})
+        debug_df = agg_errors.rename(columns={col: 'col_value'})
         debug_df['col_name'] = col
         # self.agg_df = self.agg_df.append(debug_df)
         self.agg_df = pd.concat([self.agg_df, debug_df])
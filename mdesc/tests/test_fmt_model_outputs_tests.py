@@ -77,6 +77,59 @@ class TestWhiteBoxError(unittest.TestCase):
                       fmtd_outputs,
                       """fmt_sklearn_preds on classificaiton case does not return predictions""")
 
+    def test_fmt_sklearn_preds_classification_categorical_target(self):
+        """test fmt_sklearn_preds on classification case with categorical string target"""
+
+        modelobj_class = RandomForestClassifier()
+
+        model_df = self.df.loc[:, self.df.columns != 'target']
+
+        cat_df = self.df_class.copy(deep=True)
+        cat_df['target'] = pd.Categorical(np.where(cat_df['target'] == 1, 'yes', 'no'))
+
+        modelobj_class.fit(model_df,
+                           cat_df.loc[:, 'target'])
+
+        fmtd_outputs = fmt_model_outputs.fmt_sklearn_preds(getattr(modelobj_class, 'predict_proba'),
+                                                           modelobj_class,
+                                                           model_df,
+                                                           cat_df,
+                                                           'target',
+                                                           'classification')
+
+        actual = (cat_df['target'] == modelobj_class.classes_[1]).astype(int).values
+        expected = utils.prob_acc(true_class=actual,
+                                  pred_prob=fmtd_outputs['predictedYSmooth'].values)
+
+        np.testing.assert_allclose(fmtd_outputs['errors'].values,
+                                   expected,
+                                   err_msg="""fmt_sklearn_preds returned unexpected errors for categorical target""")
+
+    def test_fmt_sklearn_preds_classification_unknown_label(self):
+        """test fmt_sklearn_preds raises KeyError for labels unseen by modelobj"""
+
+        modelobj_class = RandomForestClassifier()
+
+        model_df = self.df.loc[:, self.df.columns != 'target']
+
+        modelobj_class.fit(model_df,
+                           self.df_class.loc[:, 'target'])
+
+        cat_df = self.df_class.copy(deep=True)
+        cat_df.loc[0, 'target'] = 2
+
+        with self.assertRaises(KeyError) as context:
+            fmt_model_outputs.fmt_sklearn_preds(getattr(modelobj_class, 'predict_proba'),
+                                                modelobj_class,
+                                                model_df,
+                                                cat_df,
+                                                'target',
+                                                'classification')
+
+        self.assertIn('2',
+                      str(context.exception),
+                      """fmt_sklearn_preds KeyError does not report the unknown label""")
+
 
 if __name__ == '__main__':
     from os import sys, path
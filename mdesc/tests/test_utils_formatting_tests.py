@@ -143,6 +143,18 @@ class TestWhiteBoxError(unittest.TestCase):
                          2,
                          """flatten_json returned unexpected number of keys - check outputs""")
 
+    def test_flatten_json_data_records(self):
+        """ test flatten_json combines Data records from every dict in order """
+        test_data = [{'Type': 'Continuous', 'Data': [{'x': 1}, {'x': 2}]},
+                     {'Type': 'Continuous', 'Data': [{'x': 3}]},
+                     {'Type': 'Continuous', 'Data': [{'x': 4}, {'x': 5}]}]
+
+        test_flat = formatting.FmtJson.flatten_json(test_data)
+
+        self.assertEqual([record['x'] for record in test_flat['Data']],
+                         [1, 2, 3, 4, 5],
+                         """flatten_json did not combine Data records in order""")
+
     def test_get_html_error(self):
         """ test HTML.get_html method to retrieve correct HTML file for erro r"""
 
@@ -161,6 +173,16 @@ class TestWhiteBoxError(unittest.TestCase):
                       html_sensitivity,
                       """Impact By Variable not located in html that was loaded for html_sensitivity""")
 
+    def test_get_html_cached(self):
+        """ test HTML.get_html reuses the template read on the first call """
+
+        first = formatting.HTML.get_html(htmltype='html_error')
+        second = formatting.HTML.get_html(htmltype='html_error')
+
+        self.assertIs(first,
+                      second,
+                      """HTML.get_html re-read html_error from disc instead of using the cache""")
+
     def test_insert_data_html_error(self):
         """ test HTML.get_html method to retrieve correct HTML file for erro r"""
 
@@ -172,6 +194,23 @@ class TestWhiteBoxError(unittest.TestCase):
                       html_error,
                       """TEST data insert not located in html that was created for html_error""")
 
+    def test_insert_data_html_keeps_data_quality(self):
+        """ test HTML.fmt_html_out only relabels Quality in the template, not in the data """
+
+        testdatastring = '**Quality TEST**'
+        html_error = formatting.HTML.fmt_html_out(testdatastring,
+                                                  'yDepend',
+                                                  htmltype='html_error')
+        self.assertIn('**Quality TEST**',
+                      html_error,
+                      """fmt_html_out replaced Quality inside the inserted data""")
+        self.assertIn('var R="yDepend"',
+                      html_error,
+                      """fmt_html_out did not insert the dependent variable name""")
+        self.assertNotIn('Quality',
+                         html_error.replace('**Quality TEST**', ''),
+                         """fmt_html_out left Quality labels in the template""")
+
     def test_insert_data_html_sensitivity(self):
         """ test HTML.get_html method to retrieve correct HTML file for sensitivity """
 
@@ -183,6 +222,26 @@ class TestWhiteBoxError(unittest.TestCase):
                       html_sensitivity,
                       """TEST data insert not located in html that was created for html_sensitivity""")
 
+    def test_convert_categorical_independent_codes(self):
+        """ test convert_categorical_independent converts strings to codes without altering input """
+
+        df = self.df.copy(deep=True)
+        df.loc[:, 'col4'] = pd.Categorical(['c'] * 500 + ['d'] * 500)
+
+        converted = formatting.convert_categorical_independent(df)
+
+        self.assertEqual(converted.select_dtypes(include=['O', 'category']).shape[1],
+                         0,
+                         """convert_categorical_independent left string or category columns""")
+
+        self.assertEqual(sorted(converted['col3'].unique().tolist()),
+                         [0, 1],
+                         """convert_categorical_independent returned unexpected codes""")
+
+        self.assertEqual(df['col3'].tolist(),
+                         self.df['col3'].tolist(),
+                         """convert_categorical_independent modified the input dataframe""")
+
 
 if __name__ == '__main__':
     from os import sys, path
@@ -27,6 +27,58 @@ class TestWhiteBoxError(unittest.TestCase):
                                 \nActual MSE: {}
                                 \nRetuend MSE: {}""".format(mse_act, insights_out['MSE']))
 
+    def test_create_insights_rmse(self):
+        """test RMSE calculation from utils.create_insights"""
+
+        df = pd.DataFrame({'errors': list(range(-50, 50))})
+
+        setattr(df, 'name', 'testname')
+
+        insights_out = utils.create_insights(df, group_var='groupvar',
+                                             error_type='RMSE')
+
+        rmse_act = np.sqrt(np.mean(df['errors'] ** 2))
+
+        self.assertAlmostEqual(insights_out['RMSE'].values[0], rmse_act,
+                               msg="""utils.create_insights returning incorrect results for RMSE error
+                                \nActual RMSE: {}
+                                \nReturned RMSE: {}""".format(rmse_act, insights_out['RMSE']))
+
+    def test_create_insights_mae(self):
+        """test MAE calculation from utils.create_insights"""
+
+        df = pd.DataFrame({'errors': list(range(-50, 50))})
+
+        setattr(df, 'name', 'testname')
+
+        insights_out = utils.create_insights(df, group_var='groupvar',
+                                             error_type='MAE')
+
+        mae_act = np.mean(np.absolute(df['errors']))
+
+        self.assertAlmostEqual(insights_out['MAE'].values[0], mae_act,
+                               msg="""utils.create_insights returning incorrect results for MAE error
+                                \nActual MAE: {}
+                                \nReturned MAE: {}""".format(mae_act, insights_out['MAE']))
+
+    def test_create_insights_missing_errors(self):
+        """test create_insights skips missing errors for MSE, RMSE, MAE and MEAN"""
+
+        df = pd.DataFrame({'errors': [1.0, np.nan]})
+
+        setattr(df, 'name', 'testname')
+
+        expected = {'MSE': 1.0, 'RMSE': 1.0, 'MAE': 0.5, 'MEAN': 1.0}
+
+        for error_type, expected_val in expected.items():
+            results = utils.create_insights(df,
+                                            group_var='groupvar',
+                                            error_type=error_type)
+
+            self.assertEqual(results[error_type].values[0],
+                             expected_val,
+                             """unexpected create_insights {} with missing errors""".format(error_type))
+
     def test_create_insights_med(self):
         """test create_insights MED calc"""
         df = pd.DataFrame({'errors': list(range(100))})
@@ -105,6 +157,20 @@ class TestWhiteBoxError(unittest.TestCase):
                          \nExpected: {}
                          \nActual: {}""".format(actual_result, prob_acc_output))
 
+    def test_prob_acc_array_outputs(self):
+        """test utils.prob_acc elementwise calculation on arrays"""
+        true_class = np.array([1, 0, 1, 0])
+        pred_prob = np.array([0.8, 0.8, 0.1, 0.1])
+
+        expected = [(tc * (1 - pp)) + ((1 - tc) * pp) for tc, pp in zip(true_class, pred_prob)]
+
+        prob_acc_output = utils.prob_acc(true_class=true_class,
+                                         pred_prob=pred_prob)
+
+        np.testing.assert_allclose(prob_acc_output,
+                                   expected,
+                                   err_msg="""utils.prob_acc returned incorrect results for array inputs""")
+
     def test_create_accuracy_output_shape(self):
         """test utils.create_accuracy output"""
 
@@ -119,6 +185,32 @@ class TestWhiteBoxError(unittest.TestCase):
         self.assertEqual(output.shape, (2, 4),
                          """shape does not equal (2, 4) -- returned shape: {}""".format(output.shape))
 
+    def test_create_accuracy_matches_create_insights(self):
+        """test utils.create_accuracy metrics agree with create_insights per group"""
+
+        setup = pd.DataFrame({'errors': np.random.randn(100),
+                              'col2': ['a'] * 30 + ['b'] * 70})
+
+        for error_type in utils.Settings.supported_agg_errors:
+            output = utils.create_accuracy('regression',
+                                           setup,
+                                           error_type=error_type,
+                                           groupby='col2')
+
+            for name, group in setup.groupby('col2'):
+                setattr(group, 'name', name)
+                expected = utils.create_insights(group,
+                                                 group_var='col2',
+                                                 error_type=error_type)
+                actual = output.loc[output['groupByValue'] == name]
+
+                self.assertAlmostEqual(actual[error_type].values[0],
+                                       expected[error_type].values[0],
+                                       msg="""create_accuracy {} mismatch for group {}""".format(error_type, name))
+                self.assertEqual(actual['Total'].values[0],
+                                 expected['Total'].values[0],
+                                 """create_accuracy Total mismatch for group {}""".format(name))
+
 
 if __name__ == '__main__':
     from os import sys, path
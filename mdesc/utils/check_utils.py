@@ -86,7 +86,7 @@ class CheckInputs(object):
             warnings.warn(wb_utils.ErrorWarningMsgs.warning_msgs['cat_df'])
             cat_df = model_df.copy(deep=True)
         else:
-            cat_df = cat_df.copy(deep=True).reset_index(drop=True)
+            cat_df = cat_df.reset_index(drop=True)
             # check both model_df and cat_df have the same length
             check_consistent_length(cat_df, model_df)
             # check index's are equal
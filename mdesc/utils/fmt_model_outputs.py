@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from mdesc.utils import utils as wb_utils
 
 
@@ -33,13 +35,20 @@ def fmt_sklearn_preds(predict_engine,
         diff = preds - cat_df.loc[:, ydepend]
     elif model_type == 'classification':
         # select the prediction probabilities for the class labeled 1
-        preds = preds[:, 1].tolist()
+        preds = preds[:, 1]
         # create a lookup of class labels to numbers
         class_lookup = {class_: num for num, class_ in enumerate(modelobj.classes_)}
-        # convert the ydepend column to numeric
-        actual = cat_df.loc[:, ydepend].apply(lambda x: class_lookup[x]).values.tolist()
+        # convert the ydepend column to numeric with a single vectorized lookup
+        actual = cat_df.loc[:, ydepend].map(class_lookup)
+        # labels unseen by modelobj map to missing - raise as a lookup failure
+        if actual.isnull().any():
+            unknown = cat_df.loc[actual.isnull(), ydepend].unique().tolist()
+            raise KeyError("""ydepend labels not found in modelobj.classes_: {}""".format(unknown))
+        # cast so categorical targets yield a plain numeric array
+        actual = np.asarray(actual, dtype=float)
         # calculate the difference between actual and predicted probabilities
-        diff = [wb_utils.prob_acc(true_class=actual[idx], pred_prob=pred) for idx, pred in enumerate(preds)]
+        # for all rows at once
+        diff = wb_utils.prob_acc(true_class=actual, pred_prob=preds)
     else:
         raise RuntimeError(""""unsupported model type
                                 \nInput Model Type: {}""".format(model_type))
@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import itertools
 import pkg_resources
 import warnings
 
 import pandas as pd
-from pandas.api.types import is_numeric_dtype
+from pandas.api.types import is_numeric_dtype, is_string_dtype, CategoricalDtype
 import numpy as np
 
 
@@ -122,10 +123,9 @@ class FmtJson(object):
         json_out = json_dict[html_type]
         # create data records from values in df
         # remove long numbers by recasting
-        numcols = dataframe.select_dtypes(include=[np.number])
-        # iterate over cols and conform numbers
-        for col in numcols:
-            dataframe[col] = dataframe.loc[:, col].apply(lambda x: float(x))
+        numcols = dataframe.select_dtypes(include=[np.number]).columns
+        # conform numbers
+        dataframe[numcols] = dataframe[numcols].astype(float)
         # assign to data out
         json_out['Data'] = dataframe.to_dict(orient='records')
 
@@ -143,20 +143,18 @@ class FmtJson(object):
         :return: flattened structure with column variable as key
         :rtype: dict
         """
-        # make copy of dictlist
-        copydict = dictlist[:]
-        if len(copydict) > 1:
-            for val in copydict[1:]:
-                copydict[0]['Data'].extend(val['Data'])
-            # take the revised first element of the list
-            toreturn = copydict[0]
+        if len(dictlist) > 1:
+            # take the first element of the list and build its data
+            # from all records in a single pass
+            toreturn = dictlist[0]
+            toreturn['Data'] = list(itertools.chain.from_iterable(val['Data'] for val in dictlist))
         else:
-            if isinstance(copydict, list):
+            if isinstance(dictlist, list):
                 # return the dictionary object if list type
-                toreturn = copydict[0]
+                toreturn = dictlist[0]
             else:
                 # else return the dictionary itself
-                toreturn = copydict
+                toreturn = dictlist
         assert isinstance(toreturn, dict), """flatten_json output object not of class dict.
                                             \nOutput class type: {}""".format(type(toreturn))
         return toreturn
@@ -182,13 +180,12 @@ class FmtJson(object):
             else:
                 vartype = 'Categorical'
             i['vartype'] = vartype
-            if missing_col in list(aligned.keys()):
-                aligned[missing_col] = aligned[missing_col].append(i)
-            else:
-                aligned[missing_col] = i
+            # collect frames per variable and concatenate once below
+            aligned.setdefault(missing_col, []).append(i)
 
         aligned_json = []
-        for k, v in aligned.items():
+        for k, frames in aligned.items():
+            v = pd.concat(frames, ignore_index=True)
             vartype = v['vartype'].values[0]
             incremental_val = v['incremental_val'].values[0] if 'incremental_val' in v.columns else None
             del v['vartype']
@@ -204,23 +201,31 @@ class FmtJson(object):
 
 class HTML(object):
 
+    # html templates already read from disc, keyed by htmltype
+    _html_cache = {}
+
     @staticmethod
     def get_html(htmltype='html_error'):
         """
-        retrieve html file from disc
+        retrieve html file from disc. Templates are read once and
+        cached for subsequent calls
 
         :param htmltype: str html file to retrieve (html_error, html_sensitivity)
         :return: html text
         :rtype: str
         """
         assert htmltype in ['html_error', 'html_sensitivity'], 'htmltype must be html_error or html_sensitivity'
-        html_path = pkg_resources.resource_filename('mdesc', '{}.txt'.format(htmltype))
-        # utility class to hold mdesc files
-        try:
-            wbox_html = open('{}.txt'.format(htmltype), 'r').read()
-        except IOError:
-            wbox_html = open(html_path, 'r').read()
-        return wbox_html
+        if htmltype not in HTML._html_cache:
+            html_path = pkg_resources.resource_filename('mdesc', '{}.txt'.format(htmltype))
+            # utility class to hold mdesc files
+            try:
+                with open('{}.txt'.format(htmltype), 'r') as infile:
+                    wbox_html = infile.read()
+            except IOError:
+                with open(html_path, 'r') as infile:
+                    wbox_html = infile.read()
+            HTML._html_cache[htmltype] = wbox_html
+        return HTML._html_cache[htmltype]
 
     @staticmethod
     def fmt_html_out(
@@ -238,9 +243,13 @@ class HTML(object):
         """
         assert htmltype in ['html_error', 'html_sensitivity'], """htmltype must be html_error 
                                                                     or html_sensitivity"""
-        output = HTML.get_html(htmltype=htmltype).replace('<***>',
-                                                          datastring
-                                                          ).replace('Quality', dependentvar)
+        # label the dependent variable while the template is still small,
+        # then insert the (potentially large) data string exactly once
+        output = HTML.get_html(htmltype=htmltype).replace('Quality',
+                                                          dependentvar
+                                                          ).replace('<***>',
+                                                                    datastring,
+                                                                    1)
         return output
 
 
@@ -253,18 +262,17 @@ def convert_categorical_independent(dataframe):
     :return: dataframe that has converted strings to numbers
     :rtype: pd.DataFrame
     """
-    # we want to change the data, not copy and change
-    dataframe = dataframe.copy(deep=True)
-    # convert all strings to categories and format codes
-    for str_col in dataframe.select_dtypes(include=['O', 'category']):
-        dataframe.loc[:, str_col] = pd.Categorical(dataframe.loc[:, str_col])
-    # convert all category datatypes into numeric
-    cats = dataframe.select_dtypes(include=['category'])
+    # shallow copy is enough - converted columns are replaced wholesale,
+    # leaving the callers dataframe untouched
+    dataframe = dataframe.copy(deep=False)
+    # identify string and category columns from their dtypes in one pass
+    str_cols = [col for col, dtype in dataframe.dtypes.items()
+                if is_string_dtype(dtype) or isinstance(dtype, CategoricalDtype)]
     # warn user if no categorical variables detected
-    if cats.shape[1] == 0:
+    if len(str_cols) == 0:
         warnings.warn('Pandas categorical variable types not detected', UserWarning)
-    # iterate over these columns
-    for category in cats.columns:
-        dataframe.loc[:, category] = dataframe.loc[:, category].cat.codes
+    # convert strings and categories straight to their numeric codes
+    for str_col in str_cols:
+        dataframe[str_col] = pd.Categorical(dataframe[str_col]).codes
 
     return dataframe
@@ -92,12 +92,13 @@ class ErrorWarningMsgs(object):
 
 def prob_acc(true_class=0, pred_prob=0.2):
     """
-    return classification prediction accuracy
+    return classification prediction accuracy. Accepts scalars or
+    equal length numpy arrays, in which case accuracy is computed elementwise
 
-    :param true_class: integer containing true label 0 or 1
-    :param pred_prob: float - predicted probability
-    :return scalar - prediction accuracy
-    :rtype float
+    :param true_class: integer or array containing true labels 0 or 1
+    :param pred_prob: float or array - predicted probabilities
+    :return scalar or array - prediction accuracy
+    :rtype float|np.ndarray
     """
     return (true_class * (1-pred_prob)) + ((1-true_class)*pred_prob)
 
@@ -136,15 +137,18 @@ def create_synthetic(nrows=100,
 
     # reserve col0 for target
     cols = cols[1:]
-    # randomly select ncat cols
-    cats = list(set([random.choice(cols) for _ in range(ncat)]))
+    # randomly select ncat unique cols
+    cats = random.sample(cols, min(ncat, len(cols)))
 
     for cat in cats:
         num_bins = max(1, random.choice(list(range(max_levels))))
         bin_labels = ['level_{}'.format(level) for level in list(range(num_bins))]
-        df.loc[:, cat] = pd.cut(df.loc[:, cat], bins=num_bins,
-                                labels=bin_labels)
-        df.loc[:, cat] = df.loc[:, cat].astype(str)
+        values = df[cat].values
+        # equal width interior bin edges, matching pd.cut(bins=num_bins)
+        edges = np.linspace(values.min(), values.max(), num_bins + 1)[1:-1]
+        # store bin codes directly rather than boxing every value as a string
+        df[cat] = pd.Categorical.from_codes(np.digitize(values, edges, right=True),
+                                            categories=bin_labels)
 
     if mod_type == 'classification':
         df.loc[:, 'col0'] = pd.cut(df.loc[:, 'col0'], bins=2,
@@ -156,7 +160,7 @@ def create_synthetic(nrows=100,
     if not num_groupby:
         num_groupby = max(1, random.choice(list(range(ncat))))
 
-    catcols = df.loc[:, df.columns != 'target'].select_dtypes(include=['O']).columns.values.tolist()
+    catcols = df.loc[:, df.columns != 'target'].select_dtypes(include=['category', 'O']).columns.values.tolist()
 
     random.shuffle(catcols)
 
@@ -180,15 +184,21 @@ def create_insights(
     """
     assert error_type in Settings.supported_agg_errors, """{} unspported error type""".format(error_type)
     errors = group['errors']
-    error_dict = {'MSE': np.mean(errors ** 2),
-                  'RMSE': (np.mean(errors ** 2)) ** (1 / 2),
-                  'MAE': np.sum(np.absolute(errors))/group.shape[0],
-                  'MEAN': np.mean(errors),
-                  'MED': np.median(errors)}
+    # only compute the requested error metric
+    if error_type in ['MSE', 'RMSE']:
+        error_val = np.mean(errors * errors)
+        if error_type == 'RMSE':
+            error_val = np.sqrt(error_val)
+    elif error_type == 'MAE':
+        error_val = np.sum(np.absolute(errors)) / group.shape[0]
+    elif error_type == 'MEAN':
+        error_val = np.mean(errors)
+    else:
+        error_val = np.median(errors)
 
     errdf = pd.DataFrame({'groupByValue': group.name,
                           'groupByVarName': group_var,
-                          error_type: error_dict[error_type],
+                          error_type: error_val,
                           'Total': float(group.shape[0])}, index=[0])
     return errdf
 
@@ -211,12 +221,39 @@ def create_accuracy(model_type,
     if model_type == 'classification':
         error_type = 'MEAN'
 
-    acc = cat_df.groupby(groupby).apply(create_insights,
-                                        group_var=groupby,
-                                        error_type=error_type)
-    # drop the grouping indexing
-    acc.reset_index(drop=True, inplace=True)
-    # append to insights_df
+    assert error_type in Settings.supported_agg_errors, """{} unspported error type""".format(error_type)
+    errors = cat_df['errors']
+    # transform errors up front so each metric reduces to a built in
+    # groupby aggregation instead of a python level apply per group
+    if error_type in ['MSE', 'RMSE']:
+        # multiplication stays a single elementwise pass on large arrays,
+        # where the power operator is markedly slower
+        errors = errors * errors
+    elif error_type == 'MAE':
+        errors = errors.abs()
+
+    # only build groups for observed levels of categorical groupby variables
+    grouped = errors.groupby(cat_df[groupby],
+                             observed=True,
+                             sort=False)
+
+    totals = grouped.size()
+
+    if error_type == 'MED':
+        error_vals = grouped.median()
+    elif error_type == 'MAE':
+        # absolute errors are summed over all observations in the group
+        error_vals = grouped.sum() / totals
+    else:
+        error_vals = grouped.mean()
+
+    if error_type == 'RMSE':
+        error_vals = np.sqrt(error_vals)
+
+    acc = pd.DataFrame({'groupByValue': np.asarray(error_vals.index),
+                        'groupByVarName': groupby,
+                        error_type: error_vals.values,
+                        'Total': totals.values.astype(float)})
     return acc
 
 